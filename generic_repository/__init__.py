@@ -1,21 +1,33 @@
 # flake8: noqa F401
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from .cached import CacheRepository
-from .composition import MappedRepository
+from .cached import CacheRepository, LRUCacheRepository, QueryCacheRepository
+from .composition import MappedRepository, PooledRepository
 from .exceptions import CrudException, InvalidPayloadException, ItemNotFoundException
-from .mapper import ConstructorMapper, LambdaMapper, Mapper, ToFunctionArgsMapper
+from .mapper import (
+    ConstructorMapper,
+    IdentityMapper,
+    LambdaMapper,
+    Mapper,
+    ToFunctionArgsMapper,
+)
 from .repository import Repository
 
 GenericBaseRepository = Repository
 
-__all__ = [
+_PUBLIC = [
     # Base classes
     "Repository",
     # Cache-based implementations:
     "CacheRepository",
+    "LRUCacheRepository",
+    "QueryCacheRepository",
     # Composition:
     "MappedRepository",
+    "PooledRepository",
     "ConstructorMapper",
+    "IdentityMapper",
     "LambdaMapper",
     "Mapper",
     "ToFunctionArgsMapper",
@@ -25,31 +37,63 @@ __all__ = [
     "ItemNotFoundException",
 ]
 
-try:
+# Optional implementations are imported on first access, so that importing the
+# package does not load their dependencies.
+_OPTIONAL: Dict[str, Tuple[str, str]] = {
+    "DatabaseRepository": ("database", "sqlalchemy"),
+    "SqlalchemyMappedRepository": ("database", "sqlalchemy"),
+    "SqlalchemyModelRepository": ("database", "sqlalchemy"),
+    "HttpRepository": ("http", "httpx"),
+    "PydanticDictMapper": ("pydantic", "pydantic"),
+    "PydanticObjectMapper": ("pydantic", "pydantic"),
+}
+
+if TYPE_CHECKING:  # pragma nocover
     from .database import (
         DatabaseRepository,
         SqlalchemyMappedRepository,
         SqlalchemyModelRepository,
     )
-except ImportError:  # pragma nocover
-    pass
-else:
-    __all__ += [
-        "DatabaseRepository",
-        "SqlalchemyMappedRepository",
-        "SqlalchemyModelRepository",
-    ]
-
-try:
     from .http import HttpRepository
-except ImportError:  # pragma nocover
-    pass
-else:
-    __all__ += ["HttpRepository"]
-
-try:
     from .pydantic import PydanticDictMapper, PydanticObjectMapper
-except ImportError:  # pragma nocover
-    pass
-else:
-    __all__ += ["PydanticDictMapper", "PydanticObjectMapper"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        # Only list the optional names that can actually be imported, so that
+        # a star import does not fail on a broken optional implementation.
+        value: Any = _PUBLIC + [item for item in _OPTIONAL if _is_available(item)]
+        globals()[name] = value
+        return value
+
+    try:
+        module_name, dependency = _OPTIONAL[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    try:
+        module = importlib.import_module(f".{module_name}", __name__)
+    except ImportError as exc:  # pragma nocover
+        if (exc.name or "").partition(".")[0] == dependency:
+            message = (
+                f"`{name}` is not available because `{dependency}` is not installed."
+            )
+        else:
+            message = f"`{name}` is not available because its import failed: {exc}"
+        raise AttributeError(message) from exc
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def _is_available(name: str) -> bool:
+    try:
+        __getattr__(name)
+    except AttributeError:
+        return False
+    return True
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_OPTIONAL, "__all__"})
@@ -4,8 +4,11 @@
 Cache repository implementation.
 """
 import asyncio
+import functools
 import json
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from typing_extensions import ParamSpec
 
@@ -23,7 +26,6 @@ _Params = ParamSpec("_Params")
 
 class CacheRepository(
     Repository[_Id, _A, _U, _R, _I],
-    Generic[_Id, _A, _U, _R, _I],
 ):
     """A cached repository implementation.
 
@@ -106,6 +108,9 @@ class CacheRepository(
 
         return await data
 
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        return await self.repository.get_many(item_ids, **kwargs)
+
     async def update(self, item_id: _Id, payload: _U, **kwargs: Any) -> _I:
         result = await self.repository.update(item_id, payload, **kwargs)
         self.clear_cache()
@@ -120,3 +125,331 @@ class CacheRepository(
     async def remove(self, item_id: _Id, **kwargs: Any):
         await self.repository.remove(item_id, **kwargs)
         self.clear_cache()
+
+
+class _BoundedCache:
+    """A least-recently-used store of awaitables with optional expiration."""
+
+    __slots__ = ("maxsize", "ttl", "_entries", "_refreshing", "_generation")
+
+    def __init__(self, maxsize: int, ttl: Optional[float]) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._refreshing: Dict[Any, asyncio.Future[Any]] = {}
+        self._generation = 0
+
+    def clear(self):
+        self._entries.clear()
+        self._generation += 1
+
+    def pop(self, key):
+        self._entries.pop(key, None)
+
+    def get(self, key):
+        """Return the awaitable stored for `key`, unless it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or (entry[0] is not None and entry[0] <= time.monotonic()):
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, future):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (expires_at, future)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def set_result(self, key, result):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        self.set(key, future)
+
+    async def get_or_fetch(self, key, fetch, stale_while_revalidate=False):
+        """Return the cached result for `key`, calling `fetch` on a miss.
+
+        With `stale_while_revalidate`, an expired result is returned right away and
+        refreshed in the background.
+        """
+        future = self.get(key)
+        if future is None and stale_while_revalidate:
+            entry = self._entries.get(key)
+            if entry is not None and _succeeded(entry[1]):
+                self._refresh(key, fetch)
+                return entry[1].result()
+
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            future.add_done_callback(functools.partial(self._drop_failed, key))
+            self.set(key, future)
+
+        return await asyncio.shield(future)
+
+    def _drop_failed(self, key, future):
+        # Failed and cancelled fetches must not be served from the cache.
+        if not _succeeded(future) and self._entries.get(key, (None, None))[1] is future:
+            del self._entries[key]
+
+    def _refresh(self, key, fetch):
+        if key in self._refreshing:
+            return
+        generation = self._generation
+        task = asyncio.ensure_future(fetch())
+        self._refreshing[key] = task
+
+        def _store(task):
+            del self._refreshing[key]
+            # Drop the result if the cache was invalidated while refreshing.
+            if _succeeded(task) and generation == self._generation:
+                self.set(key, task)
+
+        task.add_done_callback(_store)
+
+
+def _succeeded(future) -> bool:
+    return future.done() and not future.cancelled() and future.exception() is None
+
+
+def _id_key(item_id: Any) -> Any:
+    """Build the cache key of an item ID, or None if it cannot be cached."""
+    if isinstance(item_id, list):
+        item_id = tuple(item_id)
+    try:
+        hash(item_id)
+    except TypeError:
+        return None
+    return item_id
+
+
+def _filters_key(query_filters: Dict[str, Any]) -> Any:
+    """Build the cache key of some query filters, or None if they cannot be cached.
+
+    Value types are part of the key, so `flag=1` and `flag=True` stay apart.
+    """
+    try:
+        return frozenset(
+            (name, type(value), value) for name, value in query_filters.items()
+        )
+    except TypeError:
+        return None
+
+
+class LRUCacheRepository(Repository[_Id, _A, _U, _R, _I]):
+    """A bounded, write-through cache for item reads.
+
+    Items retrieved with `get_by_id` are kept in a least-recently-used cache of at
+    most `maxsize` entries, optionally expiring after `ttl` seconds. Counts are
+    cached by their query filters. Concurrent misses for the same key share a single
+    call to the underlying repository.
+
+    Updated and replaced items are written to the cache, removed items are evicted
+    and any write clears the cached counts. Added items are cached only if an
+    `id_getter` is provided. Calls to `get_by_id` with extra keyword arguments and
+    `get_list` calls are not cached.
+    """
+
+    def __init__(
+        self,
+        repository: Repository[_Id, _A, _U, _R, _I],
+        *,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        id_getter: Optional[Callable[[_I], _Id]] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            repository: The repository to cache.
+            maxsize: How many items to keep. Defaults to 1024.
+            ttl: How long, in seconds, an entry is valid. Defaults to None (forever).
+            id_getter: Extracts the ID of an added item. Defaults to None.
+        """
+        super().__init__()
+        self.repository = repository
+        self.id_getter = id_getter
+        self._items = _BoundedCache(maxsize, ttl)
+        self._counts = _BoundedCache(maxsize, ttl)
+
+    def clear_cache(self):
+        """Clears the repository-level cache."""
+
+        self._items.clear()
+        self._counts.clear()
+
+    async def get_by_id(self, item_id: _Id, **kwargs: Any) -> _I:
+        key = _id_key(item_id)
+        if kwargs or key is None:
+            return await self.repository.get_by_id(item_id, **kwargs)
+        return await self._items.get_or_fetch(
+            key, lambda: self.repository.get_by_id(item_id)
+        )
+
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        item_ids = list(item_ids)
+        keys = [_id_key(item_id) for item_id in item_ids]
+        if kwargs or None in keys:
+            return await self.repository.get_many(item_ids, **kwargs)
+        missing = {
+            key: item_id
+            for key, item_id in zip(keys, item_ids)
+            if self._items.get(key) is None
+        }
+        fetched = {}
+        if missing:
+            items = await self.repository.get_many(list(missing.values()))
+            fetched = dict(zip(missing, items))
+            for key, item in fetched.items():
+                self._items.set_result(key, item)
+        return [
+            fetched[key] if key in fetched else await self.get_by_id(item_id)
+            for key, item_id in zip(keys, item_ids)
+        ]
+
+    async def get_count(self, **query_filters: Any) -> int:
+        key = _filters_key(query_filters)
+        if key is None:
+            return await self.repository.get_count(**query_filters)
+        return await self._counts.get_or_fetch(
+            key, lambda: self.repository.get_count(**query_filters)
+        )
+
+    async def get_list(
+        self,
+        *,
+        offset: Optional[int] = None,
+        size: Optional[int] = None,
+        **query_filters: Any,
+    ) -> List[_I]:
+        return await self.repository.get_list(offset=offset, size=size, **query_filters)
+
+    async def add(self, payload: _A, **kwargs: Any) -> _I:
+        result = await self.repository.add(payload, **kwargs)
+        self._counts.clear()
+        if self.id_getter is not None:
+            self._store_item(self.id_getter(result), result)
+        return result
+
+    async def update(self, item_id: _Id, payload: _U, **kwargs: Any) -> _I:
+        self._items.pop(_id_key(item_id))
+        result = await self.repository.update(item_id, payload, **kwargs)
+        self._counts.clear()
+        self._store_item(item_id, result)
+        return result
+
+    async def replace(self, item_id: _Id, payload: _R, **kwargs: Any) -> _I:
+        self._items.pop(_id_key(item_id))
+        result = await self.repository.replace(item_id, payload, **kwargs)
+        self._counts.clear()
+        self._store_item(item_id, result)
+        return result
+
+    async def remove(self, item_id: _Id, **kwargs: Any):
+        self._items.pop(_id_key(item_id))
+        await self.repository.remove(item_id, **kwargs)
+        self._counts.clear()
+
+    def _store_item(self, item_id: _Id, item: _I):
+        key = _id_key(item_id)
+        if key is not None:
+            self._items.set_result(key, item)
+
+
+class QueryCacheRepository(Repository[_Id, _A, _U, _R, _I]):
+    """A bounded cache for list and count queries.
+
+    Results of `get_list` and `get_count` are cached by their exact arguments, in a
+    least-recently-used cache of at most `maxsize` entries per method, optionally
+    expiring after `ttl` seconds. Queries whose filters are not hashable are not
+    cached. Any write clears the whole cache.
+
+    With `stale_while_revalidate`, expired results are still returned while a single
+    background refresh per query replaces them. The refresh runs concurrently with
+    the caller, so the wrapped repository must be safe to use concurrently, like a
+    `PooledRepository`; a repository sharing one `AsyncSession` is not.
+    """
+
+    def __init__(
+        self,
+        repository: Repository[_Id, _A, _U, _R, _I],
+        *,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        stale_while_revalidate: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            repository: The repository to cache.
+            maxsize: How many results to keep per method. Defaults to 128.
+            ttl: How long, in seconds, a result is fresh. Defaults to None (forever).
+            stale_while_revalidate: Return expired results while refreshing them in
+                the background. Requires a concurrency-safe repository. Defaults to
+                False.
+        """
+        super().__init__()
+        self.repository = repository
+        self.stale_while_revalidate = stale_while_revalidate
+        self._lists = _BoundedCache(maxsize, ttl)
+        self._counts = _BoundedCache(maxsize, ttl)
+
+    def clear_cache(self):
+        """Clears the repository-level cache."""
+
+        self._lists.clear()
+        self._counts.clear()
+
+    async def get_list(
+        self,
+        *,
+        offset: Optional[int] = None,
+        size: Optional[int] = None,
+        **query_filters: Any,
+    ) -> List[_I]:
+        fetch = functools.partial(
+            self.repository.get_list, offset=offset, size=size, **query_filters
+        )
+        filters_key = _filters_key(query_filters)
+        if filters_key is None:
+            return await fetch()
+        key = (filters_key, offset, size)
+
+        result = await self._lists.get_or_fetch(
+            key, fetch, stale_while_revalidate=self.stale_while_revalidate
+        )
+        return list(result)
+
+    async def get_count(self, **query_filters: Any) -> int:
+        fetch = functools.partial(self.repository.get_count, **query_filters)
+        key = _filters_key(query_filters)
+        if key is None:
+            return await fetch()
+
+        return await self._counts.get_or_fetch(
+            key, fetch, stale_while_revalidate=self.stale_while_revalidate
+        )
+
+    async def get_by_id(self, item_id: _Id, **kwargs: Any) -> _I:
+        return await self.repository.get_by_id(item_id, **kwargs)
+
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        return await self.repository.get_many(item_ids, **kwargs)
+
+    async def add(self, payload: _A, **kwargs: Any) -> _I:
+        result = await self.repository.add(payload, **kwargs)
+        self.clear_cache()
+        return result
+
+    async def update(self, item_id: _Id, payload: _U, **kwargs: Any) -> _I:
+        result = await self.repository.update(item_id, payload, **kwargs)
+        self.clear_cache()
+        return result
+
+    async def replace(self, item_id: _Id, payload: _R, **kwargs: Any) -> _I:
+        result = await self.repository.replace(item_id, payload, **kwargs)
+        self.clear_cache()
+        return result
+
+    async def remove(self, item_id: _Id, **kwargs: Any):
+        await self.repository.remove(item_id, **kwargs)
+        self.clear_cache()
@@ -3,9 +3,20 @@ Composite repository implementation.
 
 This implements a composite pattern for repositories.
 """
-from typing import Any, Generic, List, Optional, TypeVar
-
-from .mapper import Mapper
+import asyncio
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from .mapper import IdentityMapper, Mapper, _is_async_mapper
 from .repository import Repository
 from .utils import merge_dicts
 
@@ -19,6 +30,7 @@ _U = TypeVar("_U")
 _R = TypeVar("_R")
 _I = TypeVar("_I")
 _Id = TypeVar("_Id")
+_Conn = TypeVar("_Conn")
 
 
 class MappedRepository(
@@ -42,6 +54,22 @@ class MappedRepository(
     item and id for an underlying repository implementation.
     """
 
+    __slots__ = (
+        "repository",
+        "item_mapper",
+        "id_mapper",
+        "create_mapper",
+        "update_mapper",
+        "replace_mapper",
+        "_filters",
+        "_id_is_identity",
+        "_create_is_identity",
+        "_update_is_identity",
+        "_replace_is_identity",
+        "_item_is_identity",
+        "_item_is_async",
+    )
+
     def __init__(
         self,
         repository: Repository[_Id, _A, _U, _R, _I],
@@ -71,6 +99,12 @@ class MappedRepository(
         self.update_mapper = update_mapper
         self.replace_mapper = replace_mapper
         self._filters = query_filters
+        self._id_is_identity = type(id_mapper) is IdentityMapper
+        self._create_is_identity = type(create_mapper) is IdentityMapper
+        self._update_is_identity = type(update_mapper) is IdentityMapper
+        self._replace_is_identity = type(replace_mapper) is IdentityMapper
+        self._item_is_identity = type(item_mapper) is IdentityMapper
+        self._item_is_async = _is_async_mapper(item_mapper)
 
     async def add(self, payload: _MA, **kwargs: Any) -> _MI:
         """Add a new item.
@@ -81,9 +115,9 @@ class MappedRepository(
         Returns:
             _MI: The newly created item
         """
-        return await self.map_item(
-            await self.repository.add(self.create_mapper(payload), **kwargs)
-        )
+        if not self._create_is_identity:
+            payload = self.create_mapper.map_item(payload)
+        return await self.map_item(await self.repository.add(payload, **kwargs))
 
     async def update(self, item_id: _MId, payload: _MU, **kwargs: Any) -> _MI:
         """Update an item.
@@ -95,11 +129,15 @@ class MappedRepository(
         Returns:
             _MI: The updated item
         """
+        if not self._id_is_identity:
+            item_id = self.id_mapper.map_item(item_id)
+        if not self._update_is_identity:
+            payload = self.update_mapper.map_item(payload)
         return await self.map_item(
             await self.repository.update(
-                self.id_mapper(item_id),
-                self.update_mapper(payload),
-                **merge_dicts(kwargs, self._filters),
+                item_id,
+                payload,
+                **self._with_filters(kwargs),
             )
         )
 
@@ -112,10 +150,25 @@ class MappedRepository(
         Returns:
             _MI: The item
         """
+        if not self._id_is_identity:
+            item_id = self.id_mapper.map_item(item_id)
         return await self.map_item(
-            await self.repository.get_by_id(
-                self.id_mapper(item_id), **merge_dicts(kwargs, self._filters)
-            )
+            await self.repository.get_by_id(item_id, **self._with_filters(kwargs))
+        )
+
+    async def get_many(self, item_ids: Iterable[_MId], **kwargs: Any) -> List[_MI]:
+        """Retrieve several items by their IDs.
+
+        Args:
+            item_ids (Iterable[_MId]): The IDs of the items to retrieve
+
+        Returns:
+            List[_MI]: The items, in the same order as the IDs
+        """
+        if not self._id_is_identity:
+            item_ids = self.id_mapper.map_batch(item_ids)
+        return await self.map_item_list(
+            await self.repository.get_many(item_ids, **self._with_filters(kwargs))
         )
 
     async def replace(self, item_id: _MId, payload: _MR, **kwargs: Any) -> _MI:
@@ -128,11 +181,15 @@ class MappedRepository(
         Returns:
             _MI: The new item
         """
+        if not self._id_is_identity:
+            item_id = self.id_mapper.map_item(item_id)
+        if not self._replace_is_identity:
+            payload = self.replace_mapper.map_item(payload)
         return await self.map_item(
             await self.repository.replace(
-                self.id_mapper(item_id),
-                self.replace_mapper(payload),
-                **merge_dicts(kwargs, self._filters),
+                item_id,
+                payload,
+                **self._with_filters(kwargs),
             )
         )
 
@@ -142,9 +199,7 @@ class MappedRepository(
         Returns:
             int: The item count
         """
-        return await self.repository.get_count(
-            **merge_dicts(query_filters, self._filters)
-        )
+        return await self.repository.get_count(**self._with_filters(query_filters))
 
     async def get_list(
         self,
@@ -166,7 +221,7 @@ class MappedRepository(
             await self.repository.get_list(
                 offset=offset,
                 size=size,
-                **merge_dicts(query_filters, self._filters),
+                **self._with_filters(query_filters),
             )
         )
 
@@ -176,11 +231,21 @@ class MappedRepository(
         Args:
             item_id (_MId): The item ID to be removed.
         """
+        if not self._id_is_identity:
+            item_id = self.id_mapper.map_item(item_id)
         await self.repository.remove(
-            self.id_mapper(item_id),
-            **merge_dicts(kwargs, self._filters),
+            item_id,
+            **self._with_filters(kwargs),
         )
 
+    def _with_filters(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Most calls have no extra arguments or no filters: skip the merge then.
+        if not kwargs:
+            return self._filters
+        if not self._filters:
+            return kwargs
+        return merge_dicts(kwargs, self._filters)
+
     async def map_item(self, item: _I) -> _MI:
         """Transform an item.
 
@@ -190,7 +255,11 @@ class MappedRepository(
         Returns:
             _MI: The transformed item
         """
-        return self.item_mapper(item)
+        if self._item_is_identity:
+            return item  # type: ignore
+        if self._item_is_async:
+            return await self.item_mapper.amap_item(item)
+        return self.item_mapper.map_item(item)
 
     async def map_item_list(self, item_list: List[_I]) -> List[_MI]:
         """Map an item list to the correct representation.
@@ -201,4 +270,93 @@ class MappedRepository(
         Returns:
             List[_MI]: The mapped item list
         """
-        return [self.item_mapper(item) for item in item_list]
+        if self._item_is_identity:
+            return item_list  # type: ignore
+        if self._item_is_async:
+            return list(
+                await asyncio.gather(*map(self.item_mapper.amap_item, item_list))
+            )
+        return self.item_mapper.map_batch(item_list)
+
+
+class PooledRepository(
+    Repository[_Id, _A, _U, _R, _I],
+    Generic[_Conn, _Id, _A, _U, _R, _I],
+):
+    """Run every operation on its own pooled connection.
+
+    Each call acquires a connection, builds a repository bound to it and releases the
+    connection as soon as the call returns. This allows concurrent use of
+    repositories whose connection, like a SQLAlchemy `AsyncSession`, cannot be shared
+    between tasks.
+
+    With SQLAlchemy, pass the `begin` method of an async session maker so that every
+    operation runs in its own transaction, committed on success:
+    `PooledRepository(sessionmaker.begin, TodoRepository)`.
+    """
+
+    __slots__ = ("acquire", "repository_factory")
+
+    def __init__(
+        self,
+        acquire: Callable[[], AsyncContextManager[_Conn]],
+        repository_factory: Callable[[_Conn], Repository[_Id, _A, _U, _R, _I]],
+    ) -> None:
+        """Initialize the `PooledRepository` instance.
+
+        Args:
+            acquire: Returns an async context manager yielding a connection and
+                releasing it on exit, like `asyncpg.Pool.acquire`.
+            repository_factory: Builds the repository for a connection.
+        """
+        super().__init__()
+        self.acquire = acquire
+        self.repository_factory = repository_factory
+
+    async def add(self, payload: _A, **kwargs: Any) -> _I:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).add(payload, **kwargs)
+
+    async def update(self, item_id: _Id, payload: _U, **kwargs: Any) -> _I:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).update(
+                item_id, payload, **kwargs
+            )
+
+    async def get_by_id(self, item_id: _Id, **kwargs: Any) -> _I:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).get_by_id(
+                item_id, **kwargs
+            )
+
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).get_many(
+                item_ids, **kwargs
+            )
+
+    async def replace(self, item_id: _Id, payload: _R, **kwargs: Any) -> _I:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).replace(
+                item_id, payload, **kwargs
+            )
+
+    async def get_count(self, **query_filters: Any) -> int:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).get_count(**query_filters)
+
+    async def get_list(
+        self,
+        *,
+        offset: Optional[int] = None,
+        size: Optional[int] = None,
+        **query_filters: Any,
+    ) -> List[_I]:
+        async with self.acquire() as connection:
+            return await self.repository_factory(connection).get_list(
+                offset=offset, size=size, **query_filters
+            )
+
+    async def remove(self, item_id: _Id, **kwargs: Any):
+        async with self.acquire() as connection:
+            await self.repository_factory(connection).remove(item_id, **kwargs)
@@ -22,7 +22,7 @@ from typing import (
     cast,
 )
 
-from sqlalchemy import Column, func, inspect, select
+from sqlalchemy import Column, func, inspect, select, tuple_
 from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -42,6 +42,29 @@ _U = TypeVar("_U")
 _Id = TypeVar("_Id")
 
 
+def _coerce_id(column: Any, value: Any) -> Any:
+    """Convert an ID value to the Python type of its column.
+
+    The database converts the values of a query, but the rows match back to
+    the requested IDs in Python, so `"1"` and `1` would not be the same key.
+    Lossy conversions, like `1.5` to `1`, keep the original value, so that the
+    ID is not found instead of matching another row.
+    """
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if isinstance(value, python_type):
+        return value
+    try:
+        coerced = python_type(value)
+    except (TypeError, ValueError):
+        return value
+    if coerced == value or (isinstance(value, str) and str(coerced) == value):
+        return coerced
+    return value
+
+
 class DatabaseRepository(
     Generic[_Model, _A, _U, _R, _I, _Id],
     Repository[_Id, _A, _U, _R, _I],
@@ -111,7 +134,7 @@ class DatabaseRepository(
                     class_name=f"{cls.__module__}.{cls.__qualname__}",  # type: ignore
                 )
             )
-        return cast(Type[_Model], cls.model_class)
+        return cast("Type[_Model]", cls.model_class)
 
     def get_base_query(self) -> Select:
         """Retrieve a base query.
@@ -233,6 +256,36 @@ class DatabaseRepository(
             self._map_item, await self.get_unmapped_by_id(item_id, **kwargs)
         )
 
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        """Retrieve several items with a single query.
+
+        Args:
+            item_ids (Iterable[_Id]): The IDs of the items
+
+        Raises:
+            ItemNotFoundException: If any item does not exist
+
+        Returns:
+            List[_I]: The items, in the same order as the IDs
+        """
+        id_field = self.get_id_field()
+        item_ids = [_coerce_id(id_field, item_id) for item_id in item_ids]
+        if not item_ids:
+            return []
+
+        query = (
+            self.decorate_query(self.get_base_query(), **kwargs)
+            .add_columns(id_field)
+            .where(id_field.in_(set(item_ids)))
+        )
+        found = {item_id: model for model, item_id in await self.session.execute(query)}
+        try:
+            models = [found[item_id] for item_id in item_ids]
+        except KeyError:
+            raise ItemNotFoundException() from None
+
+        return await self.session.run_sync(self._map_items, models)
+
     async def get_count(self, **query_filters: Any) -> int:
         """Retrieve the number of items in the database.
 
@@ -355,7 +408,6 @@ class _QueryFilter(Protocol):  # pragma: nocover
 
 class SqlalchemyModelRepository(
     Repository[Any, Dict[str, Any], Dict[str, Any], Dict[str, Any], _Model],
-    Generic[_Model],
     abc.ABC,
 ):
     """A sqlalchemy database model repository."""
@@ -444,7 +496,7 @@ class SqlalchemyModelRepository(
             model_qualname = f"{model_class.__module__}.{model_class.__qualname__}"
             raise AssertionError(f"Class `{model_qualname}` is not a SQLAlchemy model.")
 
-        return cast(Type[_Model], model_class)
+        return cast("Type[_Model]", model_class)
 
     @property
     def primary_key_columns(self):
@@ -468,6 +520,12 @@ class SqlalchemyModelRepository(
 
     def _match_id(self, query: Select, item_id: Any) -> Select:
         primary_key = self.primary_key_columns
+        for idx, value in enumerate(self._id_values(primary_key, item_id)):
+            query = query.where(primary_key[idx] == value)
+
+        return query
+
+    def _id_values(self, primary_key: Sequence[Any], item_id: Any) -> Tuple[Any, ...]:
         values: Tuple[Any, ...] = ()
         if len(primary_key) == 0:
             raise AssertionError("Invalid primary key: No columns specified.")
@@ -480,10 +538,7 @@ class SqlalchemyModelRepository(
                 f"Primary key has {len(primary_key)} columns and the `item_id` is "
                 f"{len(values)} length."
             )
-        for idx, value in enumerate(values):
-            query = query.where(primary_key[idx] == value)
-
-        return query
+        return values
 
     def filter_query(
         self,
@@ -652,6 +707,43 @@ class SqlalchemyModelRepository(
 
         return instance
 
+    async def get_many(
+        self, item_ids: Iterable[Any], **query_filters: Any
+    ) -> List[_Model]:
+        """Retrieve several items with a single query.
+
+        Args:
+            item_ids (Iterable[Any]): The IDs to retrieve
+
+        Raises:
+            ItemNotFoundException: If any item does not exist in the database
+
+        Returns:
+            List[_Model]: The items, in the same order as the IDs
+        """
+        primary_key = self.primary_key_columns
+        keys = [
+            tuple(map(_coerce_id, primary_key, self._id_values(primary_key, item_id)))
+            for item_id in item_ids
+        ]
+        if not keys:
+            return []
+
+        if len(primary_key) == 1:
+            condition = primary_key[0].in_({key[0] for key in keys})
+        else:
+            condition = tuple_(*primary_key).in_(set(keys))
+        query = (
+            self.filter_query(query=self.get_items_query(), **query_filters)
+            .add_columns(*primary_key)
+            .where(condition)
+        )
+        found = {tuple(row[1:]): row[0] for row in await self.session.execute(query)}
+        try:
+            return [found[key] for key in keys]
+        except KeyError:
+            raise ItemNotFoundException("Instance not found in database.") from None
+
     async def get_list(
         self,
         *,
@@ -871,7 +963,6 @@ class SqlalchemyMappedRepository(
         Dict[str, Any],
         _Model,
     ],
-    Generic[_Id, _A, _U, _R, _I, _Model],
 ):
     """A SQLAlchemy mapped repository."""
 
@@ -952,10 +1043,18 @@ class SqlalchemyMappedRepository(
         return query
 
     async def map_item(self, item: _Model) -> _I:
-        return await self.session.run_sync(lambda s, i: self.item_mapper(i), item)
+        # Asynchronous item mappers cannot be awaited inside `run_sync`, so they
+        # run on the event loop and must not trigger lazy loads.
+        if self._item_is_async:
+            return await super().map_item(item)
+        return await self.session.run_sync(
+            lambda s, i: self.item_mapper.map_item(i), item
+        )
 
     async def map_item_list(self, item_list: List[_Model]) -> List[_I]:
+        if self._item_is_async:
+            return await super().map_item_list(item_list)
         return await self.session.run_sync(
-            lambda session, items: [self.item_mapper(item) for item in items],
+            lambda session, items: self.item_mapper.map_batch(items),
             item_list,
         )
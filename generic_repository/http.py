@@ -45,10 +45,10 @@ class HttpRepository(Repository[str, Any, Any, Any, Any]):
         self._base_url = base_url
         self._request_params = request_params
         self.count_mapper = count_mapper or LambdaMapper(
-            lambda x: len(cast(List[Any], x))
+            lambda x: len(cast("List[Any]", x))
         )
 
-        self.list_mapper = list_mapper or LambdaMapper(lambda x: cast(List[Any], x))
+        self.list_mapper = list_mapper or LambdaMapper(lambda x: cast("List[Any]", x))
         self.add_slash = add_slash
 
     @property
@@ -5,11 +5,13 @@ Data mappers.
 These constructs are used to apply data transformations in various places.
 """
 import abc
+import operator
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -50,6 +52,9 @@ class Mapper(Generic[_In, _Out], abc.ABC):
     NotImplementedError: ...
     """
 
+    # Subclasses add their own slots; instances stay weak-referenceable.
+    __slots__ = ("__weakref__",)
+
     def __call__(self, value: _In) -> _Out:
         """Process the input argument.
 
@@ -72,6 +77,41 @@ class Mapper(Generic[_In, _Out], abc.ABC):
             _Out: The output representation.
         """
 
+    def map_batch(self, items: Iterable[_In]) -> List[_Out]:
+        """Map a batch of items at once.
+
+        Subclasses may override this to convert every item in a single call.
+
+        Args:
+            items (Iterable[_In]): The items to map.
+
+        Returns:
+            List[_Out]: The output representations, in the same order.
+
+        >>> mapper = LambdaMapper(lambda x: x*2)
+        >>> mapper.map_batch([1, 2, 3])
+        [2, 4, 6]
+        """
+        return list(map(self.map_item, items))
+
+    async def amap_item(self, item: _In) -> _Out:
+        """Map an item asynchronously.
+
+        Override this for mappers doing I/O, like fetching related objects.
+        `MappedRepository` then maps the items of a list concurrently.
+
+        Args:
+            item (_In): The item to map.
+
+        Returns:
+            _Out: The output representation.
+
+        >>> import asyncio
+        >>> asyncio.run(LambdaMapper(lambda x: x*2).amap_item(3))
+        6
+        """
+        return self.map_item(item)
+
     def reverse_map(self, out: _Out) -> _In:
         """Reverse the mapping process.
 
@@ -102,6 +142,11 @@ class Mapper(Generic[_In, _Out], abc.ABC):
         >>> mapper2.reverse_map(24)
         3.0
 
+        Attribute and method mappers avoid writing a lambda:
+        >>> mapper3=LambdaMapper.attr('real').chain(LambdaMapper.method('__add__', 1))
+        >>> mapper3(3+4j)
+        4.0
+
         Raises if any other type is provided.
         >>> mapper.chain('x')
         Traceback (most recent call last):
@@ -109,7 +154,7 @@ class Mapper(Generic[_In, _Out], abc.ABC):
         TypeError: ...
         >>>
         """
-        return DecoratedMapper(self, mapper)
+        return PipelineMapper(self, mapper)
 
     def chain_lambda(
         self,
@@ -178,9 +223,17 @@ class Mapper(Generic[_In, _Out], abc.ABC):
         return self.chain(other)  # type: ignore
 
     @staticmethod
-    def identity() -> "Mapper[_In, _In]":  # pragma nocover
-        """The identity mapper."""
-        return LambdaMapper[_In, _In](lambda x: x, lambda x: x)
+    def identity() -> "Mapper[_In, _In]":
+        """The identity mapper.
+
+        The same instance is returned on every call.
+
+        >>> Mapper.identity()(3)
+        3
+        >>> Mapper.identity() is Mapper.identity()
+        True
+        """
+        return IDENTITY
 
 
 class LambdaMapper(Mapper[_In, _Out]):
@@ -212,8 +265,17 @@ class LambdaMapper(Mapper[_In, _Out]):
     20
     >>> mapper3.reverse_map(20)
     4.0
+
+    To extract an attribute or call a method of the item, prefer the `attr` and
+    `method` constructors over a lambda:
+    >>> LambdaMapper.attr('imag')(3+4j)
+    4.0
+    >>> LambdaMapper.method('upper')('abc')
+    'ABC'
     """
 
+    __slots__ = ("func", "reverse_func", "mapper_kwargs")
+
     def __init__(
         self,
         func: Callable[[_In], _Out],
@@ -225,15 +287,72 @@ class LambdaMapper(Mapper[_In, _Out]):
         self.reverse_func = reverse_func
         self.mapper_kwargs = kwargs
 
+    @classmethod
+    def attr(cls, *names: str) -> "LambdaMapper[Any, Any]":
+        """Build a mapper retrieving an attribute of the item.
+
+        Args:
+            names: The attribute name, dotted names are supported. If more than one
+                name is given, a tuple of the attributes is returned.
+
+        Returns:
+            LambdaMapper[Any, Any]: The mapper, backed by `operator.attrgetter`.
+        """
+        return cls(operator.attrgetter(*names))
+
+    @classmethod
+    def method(cls, name: str, *args: Any, **kwargs: Any) -> "LambdaMapper[Any, Any]":
+        """Build a mapper calling a method of the item.
+
+        Args:
+            name: The method name.
+            args: Positional arguments for the method call.
+            kwargs: Keyword arguments for the method call.
+
+        Returns:
+            LambdaMapper[Any, Any]: The mapper, backed by `operator.methodcaller`.
+        """
+        return cls(operator.methodcaller(name, *args, **kwargs))
+
     def map_item(self, item: _In) -> _Out:
-        return self.func(item, **self.mapper_kwargs)
+        if self.mapper_kwargs:
+            return self.func(item, **self.mapper_kwargs)
+        return self.func(item)  # type: ignore
 
     def reverse_map(self, out: _Out) -> _In:
         if self.reverse_func is not None:
-            return self.reverse_func(out, **self.mapper_kwargs)
+            if self.mapper_kwargs:
+                return self.reverse_func(out, **self.mapper_kwargs)
+            return self.reverse_func(out)  # type: ignore
         return super().reverse_map(out)
 
 
+class IdentityMapper(Mapper[_In, _In]):
+    """A mapper returning its input unchanged.
+
+    Consumers such as `MappedRepository` detect this mapper and skip calling it.
+    Use the shared `IDENTITY` instance or `Mapper.identity()`.
+
+    Example:
+    >>> mapper = IdentityMapper()
+    >>> mapper(4)
+    4
+    >>> mapper.reverse_map(4)
+    4
+    """
+
+    __slots__ = ()
+
+    def map_item(self, item: _In) -> _In:
+        return item
+
+    def reverse_map(self, out: _In) -> _In:
+        return out
+
+
+IDENTITY: IdentityMapper[Any] = IdentityMapper()
+
+
 _Obj = TypeVar("_Obj")
 
 
@@ -242,6 +361,44 @@ class _Arguments(NamedTuple):
     kwargs: Dict[str, Any]
 
 
+def _dict_arguments(item: Dict[str, Any], default_kwargs: Dict[str, Any]) -> _Arguments:
+    if default_kwargs:
+        return _Arguments((), {**default_kwargs, **item})
+    return _Arguments((), dict(item))
+
+
+def _tuple_arguments(
+    item: Tuple[Any, ...], default_kwargs: Dict[str, Any]
+) -> _Arguments:
+    # Tuples are immutable, so they can be passed as they are.
+    return _Arguments(item, dict(default_kwargs))
+
+
+def _sequence_arguments(
+    item: Sequence[Any], default_kwargs: Dict[str, Any]
+) -> _Arguments:
+    return _Arguments(tuple(item), dict(default_kwargs))
+
+
+_ArgumentBuilder = Callable[[Any, Dict[str, Any]], _Arguments]
+
+_ARGUMENT_BUILDERS: Dict[type, _ArgumentBuilder] = {
+    dict: _dict_arguments,
+    tuple: _tuple_arguments,
+    list: _sequence_arguments,
+    set: _sequence_arguments,
+}
+
+
+def _find_argument_builder(item: Any) -> _ArgumentBuilder:
+    """Resolve the argument builder for subclasses of the supported types."""
+    if isinstance(item, dict):
+        return _dict_arguments
+    if isinstance(item, (tuple, list, set)):
+        return _sequence_arguments
+    raise TypeError("Type not supported.")
+
+
 class ToFunctionArgsMapper(Mapper[Union[Dict[str, Any], Sequence[Any]], _Arguments]):
     """Maps a dict to kwargs part of a function call.
 
@@ -256,6 +413,11 @@ class ToFunctionArgsMapper(Mapper[Union[Dict[str, Any], Sequence[Any]], _Argumen
     _Arguments(args=(3,), kwargs={})
     >>> mapper((3,))
     _Arguments(args=(3,), kwargs={})
+
+    Subclasses of the supported types are accepted too:
+    >>> from collections import OrderedDict
+    >>> mapper(OrderedDict(x=3))
+    _Arguments(args=(), kwargs={'x': 3})
     >>> mapper('x')
     Traceback (most recent call last):
       ...
@@ -263,22 +425,17 @@ class ToFunctionArgsMapper(Mapper[Union[Dict[str, Any], Sequence[Any]], _Argumen
     >>>
     """
 
+    __slots__ = ("default_kwargs",)
+
     def __init__(self, **default_kwargs: Any) -> None:
         super().__init__()
         self.default_kwargs = default_kwargs
 
     def map_item(self, item: Union[Dict[str, Any], Sequence[Any]]) -> _Arguments:
-        args: List[Any] = []
-        kwargs: Dict[str, Any] = {}
-        kwargs.update(self.default_kwargs)
-        if isinstance(item, dict):
-            kwargs.update(item)
-        elif isinstance(item, (tuple, list, set)):
-            args.extend(item)
-        else:
-            raise TypeError("Type not supported.")
-
-        return _Arguments(tuple(args), kwargs)
+        builder = _ARGUMENT_BUILDERS.get(type(item))
+        if builder is None:
+            builder = _find_argument_builder(item)
+        return builder(item, self.default_kwargs)
 
     def reverse_map(self, out: _Arguments) -> Union[Tuple[Any, ...], Dict[str, Any]]:
         """Perform the reverse map of the arguments.
@@ -301,7 +458,7 @@ class ToFunctionArgsMapper(Mapper[Union[Dict[str, Any], Sequence[Any]], _Argumen
         return out.kwargs
 
 
-class ConstructorMapper(Mapper[_Arguments, _Obj], Generic[_Obj]):
+class ConstructorMapper(Mapper[_Arguments, _Obj]):
     """A from-args to object mapper.
 
     Example:
@@ -328,9 +485,11 @@ class ConstructorMapper(Mapper[_Arguments, _Obj], Generic[_Obj]):
     AssertionError: ...
     """
 
+    __slots__ = ("cls", "_default_kw")
+
     def __init__(self, cls: Type[_Obj], **default_kwargs: Any) -> None:
         super().__init__()
-        if not isinstance(cls, type):
+        if __debug__ and not isinstance(cls, type):
             raise AssertionError("The provided object is not a valid class.")
         self.cls = cls
         self._default_kw = default_kwargs
@@ -371,25 +530,157 @@ class DecoratedMapper(Mapper[_In, _Out]):
     >>>
     """
 
+    __slots__ = ("first", "second")
+
     def __init__(
         self, first: Mapper[_In, _Intermediate], second: Mapper[_Intermediate, _Out]
     ) -> None:
         super().__init__()
-        if not isinstance(first, Mapper):  # type: ignore
-            raise TypeError("`first` parameter is not a mapper instance.")
+        if __debug__:
+            if not isinstance(first, Mapper):  # type: ignore
+                raise TypeError("`first` parameter is not a mapper instance.")
 
-        if not isinstance(second, Mapper):  # type: ignore
-            raise TypeError("`second` is not a mapper instance.")
+            if not isinstance(second, Mapper):  # type: ignore
+                raise TypeError("`second` is not a mapper instance.")
 
         self.first, self.second = first, second
 
     def map_item(self, item: _In) -> _Out:
         return self.second.map_item(self.first.map_item(item))
 
+    def map_batch(self, items: Iterable[_In]) -> List[_Out]:
+        results: Iterable[Any] = items
+        for mapper in (self.first, self.second):
+            batch = _batch_func(mapper)
+            results = map(mapper.map_item, results) if batch is None else batch(results)
+        return list(results)
+
+    async def amap_item(self, item: _In) -> _Out:
+        return await self.second.amap_item(await self.first.amap_item(item))
+
     def reverse_map(self, out: _Out) -> _In:
         return self.first.reverse_map(self.second.reverse_map(out))
 
 
+def _forward_func(mapper: Mapper[Any, Any]) -> Callable[[Any], Any]:
+    """Return the cheapest callable doing `mapper.map_item`."""
+    if type(mapper) is LambdaMapper and not mapper.mapper_kwargs:
+        return mapper.func
+    return mapper.map_item
+
+
+def _reverse_func(mapper: Mapper[Any, Any]) -> Callable[[Any], Any]:
+    """Return the cheapest callable doing `mapper.reverse_map`."""
+    if (
+        type(mapper) is LambdaMapper
+        and not mapper.mapper_kwargs
+        and mapper.reverse_func is not None
+    ):
+        return mapper.reverse_func
+    return mapper.reverse_map
+
+
+def _batch_func(mapper: Mapper[Any, Any]) -> Optional[Callable[[Iterable[Any]], Any]]:
+    """Return `mapper.map_batch` if the mapper converts batches on its own."""
+    if getattr(type(mapper), "map_batch", Mapper.map_batch) is Mapper.map_batch:
+        return None
+    return mapper.map_batch
+
+
+def _is_async_mapper(mapper: Any) -> bool:
+    """Tell whether mapping an item through `mapper` awaits anything.
+
+    Pipelines and decorated mappers are asynchronous when any of their members is.
+    """
+    amap_item = getattr(type(mapper), "amap_item", Mapper.amap_item)
+    if amap_item is PipelineMapper.amap_item:
+        return any(mapper._async_stages)
+    if amap_item is DecoratedMapper.amap_item:
+        return _is_async_mapper(mapper.first) or _is_async_mapper(mapper.second)
+    return amap_item is not Mapper.amap_item
+
+
+class PipelineMapper(Mapper[_In, _Out]):
+    """Runs a flat sequence of mappers, one after the other.
+
+    Nested pipelines are flattened at construction time, so mapping an item walks
+    a single list instead of a tree of mappers.
+
+    Example:
+    >>> double = LambdaMapper(lambda x: x*2, lambda x: x/2)
+    >>> triple = LambdaMapper(lambda x: x*3, lambda x: x/3)
+    >>> pipeline = PipelineMapper(PipelineMapper(double, triple), double)
+    >>> len(pipeline.mappers)
+    3
+    >>> pipeline(2)
+    24
+    >>> pipeline.reverse_map(24)
+    2.0
+
+    Non-mapper instances are not accepted:
+    >>> PipelineMapper(double, 'x')
+    Traceback (most recent call last):
+      ...
+    TypeError: ...
+    >>>
+    """
+
+    __slots__ = ("mappers", "_forward", "_reverse", "_batch", "_async_stages")
+
+    def __init__(self, *mappers: Mapper[Any, Any]) -> None:
+        super().__init__()
+        flattened: List[Mapper[Any, Any]] = []
+        for mapper in mappers:
+            if isinstance(mapper, PipelineMapper):
+                flattened.extend(mapper.mappers)
+            elif isinstance(mapper, Mapper):  # type: ignore
+                flattened.append(mapper)
+            else:
+                raise TypeError("All the pipeline members must be mapper instances.")
+
+        self.mappers: Tuple[Mapper[Any, Any], ...] = tuple(flattened)
+        # Plain lambda mappers are called through their function directly.
+        self._forward = tuple(map(_forward_func, self.mappers))
+        self._reverse = tuple(map(_reverse_func, reversed(self.mappers)))
+        self._batch = tuple(map(_batch_func, self.mappers))
+        self._async_stages = tuple(map(_is_async_mapper, self.mappers))
+
+    def map_item(self, item: _In) -> _Out:
+        for func in self._forward:
+            item = func(item)
+        return item  # type: ignore
+
+    def map_batch(self, items: Iterable[_In]) -> List[_Out]:
+        """Map a batch of items through every stage of the pipeline.
+
+        The stages are stacked as lazy `map` iterators, so the items are driven
+        through the pipeline by C code instead of a Python loop. Stages with their
+        own `map_batch`, like `PydanticObjectMapper`, convert the whole batch.
+
+        >>> pipeline = PipelineMapper(
+        ...     LambdaMapper(lambda x: x*2), LambdaMapper.method('__add__', 1)
+        ... )
+        >>> pipeline.map_batch([1, 2, 3])
+        [3, 5, 7]
+        """
+        results: Iterable[Any] = items
+        for func, batch in zip(self._forward, self._batch):
+            results = map(func, results) if batch is None else batch(results)
+        return list(results)
+
+    async def amap_item(self, item: _In) -> _Out:
+        for mapper, func, is_async in zip(
+            self.mappers, self._forward, self._async_stages
+        ):
+            item = await mapper.amap_item(item) if is_async else func(item)
+        return item  # type: ignore
+
+    def reverse_map(self, out: _Out) -> _In:
+        for func in self._reverse:
+            out = func(out)
+        return out  # type: ignore
+
+
 class InverseMapper(Mapper[_Out, _In], Generic[_In, _Out]):
     """A reverse mapper.
 
@@ -399,6 +690,8 @@ class InverseMapper(Mapper[_Out, _In], Generic[_In, _Out]):
     Normally, this is not instantiated directly. Insthead, use the `inverse` operator.
     """
 
+    __slots__ = ("mapper",)
+
     def __init__(self, mapper: Mapper[_In, _Out]) -> None:
         super().__init__()
         self.mapper = mapper
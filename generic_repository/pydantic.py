@@ -4,7 +4,7 @@ Pydantic mappers for repositories.
 
 These are data transformation utilities.
 """
-from typing import Any, Dict, Generic, Type, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 
 import pydantic
 
@@ -12,8 +12,12 @@ from .mapper import Mapper
 
 _Model = TypeVar("_Model", bound=pydantic.BaseModel)
 
+# Pydantic v2 replaces `from_orm` with `model_validate` and compiles validators in
+# pydantic-core.
+_PYDANTIC_V2 = hasattr(pydantic.BaseModel, "model_validate")
 
-class PydanticDictMapper(Mapper[_Model, Dict[str, Any]], Generic[_Model]):
+
+class PydanticDictMapper(Mapper[_Model, Dict[str, Any]]):
     """Pydantic to dict converter.
 
     Example:
@@ -40,22 +44,27 @@ class PydanticDictMapper(Mapper[_Model, Dict[str, Any]], Generic[_Model]):
     >>>
     """
 
+    __slots__ = ("_model_classes", "_dict_kwargs")
+
     def __init__(self, *model_classes: Type[_Model], **dict_kwargs: Any) -> None:
         """Initialize a new pydantic dict mapper.
 
         Supply a list of valid models.
 
         Raises:
-            TypeError: If any model is invalid.
+            TypeError: If any model is invalid. Not checked under `python -O`.
         """
-        for model in model_classes:
-            if not issubclass(model, pydantic.BaseModel):
-                class_name = f"{model.__module__}.{model.__qualname__}"
-                raise TypeError(f"The class `{class_name}` is not a pydantic model.")
+        if __debug__:
+            for model in model_classes:
+                if not issubclass(model, pydantic.BaseModel):
+                    class_name = f"{model.__module__}.{model.__qualname__}"
+                    raise TypeError(
+                        f"The class `{class_name}` is not a pydantic model."
+                    )
 
         super().__init__()
 
-        self._model_classes = model_classes
+        self._model_classes = tuple(model_classes)
         self._dict_kwargs = dict_kwargs
 
     def map_item(self, item: _Model) -> Dict[str, Any]:
@@ -70,18 +79,23 @@ class PydanticDictMapper(Mapper[_Model, Dict[str, Any]], Generic[_Model]):
         Returns:
             Dict[str, Any]: The resulting dict
         """
-        if not any(map(lambda x: isinstance(item, x), self._model_classes)):
+        if not isinstance(item, self._model_classes):
             raise AssertionError("The passed object isnot of any provided class.")
 
-        return item.dict(**self._dict_kwargs)
+        if self._dict_kwargs:
+            return item.dict(**self._dict_kwargs)
+        return item.dict()
 
 
-class PydanticObjectMapper(Mapper[Any, _Model], Generic[_Model]):
+class PydanticObjectMapper(Mapper[Any, _Model]):
     """Pydantic object mapper.
 
-    This requires the orm mode to be enabled in the models.
+    This requires the orm mode (`from_attributes` in pydantic v2) to be enabled in
+    the models.
     """
 
+    __slots__ = ("model_class", "_validate", "_list_adapter")
+
     def __init__(self, model_class: Type[_Model]) -> None:
         """Initialize a new object mapper.
 
@@ -106,7 +120,11 @@ class PydanticObjectMapper(Mapper[Any, _Model], Generic[_Model]):
         >>> PydanticObjectMapper(A)
         <...>
         """
-        if not model_class.Config.orm_mode:
+        if _PYDANTIC_V2:
+            orm_mode = model_class.model_config.get("from_attributes", False)
+        else:
+            orm_mode = model_class.Config.orm_mode
+        if not orm_mode:
             model_class_qualname = (
                 f"{model_class.__module__}.{model_class.__qualname__}"
             )
@@ -114,6 +132,11 @@ class PydanticObjectMapper(Mapper[Any, _Model], Generic[_Model]):
                 f"The class `{model_class_qualname}` is not an orm mode object."
             )
         self.model_class = model_class
+        if _PYDANTIC_V2:
+            self._validate = model_class.model_validate
+        else:
+            self._validate = model_class.from_orm
+        self._list_adapter: Optional[Any] = None
 
     def map_item(self, item: Any) -> _Model:
         """Perform the object conversion.
@@ -124,4 +147,23 @@ class PydanticObjectMapper(Mapper[Any, _Model], Generic[_Model]):
         Returns:
             _Model: The instance of the model
         """
-        return self.model_class.from_orm(item)
+        return self._validate(item)
+
+    def map_batch(self, items: Iterable[Any]) -> List[_Model]:
+        """Convert a batch of objects.
+
+        With pydantic v2, the whole batch is validated in a single call to a list
+        validator, built on first use.
+
+        Args:
+            items (Iterable[Any]): The objects to parse
+
+        Returns:
+            List[_Model]: The model instances
+        """
+        if _PYDANTIC_V2:
+            if self._list_adapter is None:
+                self._list_adapter = pydantic.TypeAdapter(List[self.model_class])
+            return self._list_adapter.validate_python(list(items), from_attributes=True)
+        validate = self._validate
+        return [validate(item) for item in items]
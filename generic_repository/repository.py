@@ -4,7 +4,8 @@ The repository module.
 This module contains the base class `Repository`.
 """
 import abc
-from typing import Any, Generic, List, Optional, TypeVar
+import asyncio
+from typing import Any, Generic, Iterable, List, Optional, TypeVar
 
 _A = TypeVar("_A")
 _U = TypeVar("_U")
@@ -16,6 +17,9 @@ _Id = TypeVar("_Id")
 class Repository(Generic[_Id, _A, _U, _R, _I], abc.ABC):  # pragma nocover
     """Base class for all CRUD implementations."""
 
+    # Subclasses add their own slots; instances stay weak-referenceable.
+    __slots__ = ("__weakref__",)
+
     @abc.abstractmethod
     async def get_by_id(self, item_id: _Id, **kwargs: Any) -> _I:
         """Retrieve an item by it's ID.
@@ -31,6 +35,27 @@ class Repository(Generic[_Id, _A, _U, _R, _I], abc.ABC):  # pragma nocover
         """
         raise NotImplementedError()
 
+    async def get_many(self, item_ids: Iterable[_Id], **kwargs: Any) -> List[_I]:
+        """Retrieve several items by their IDs.
+
+        The default implementation calls `get_by_id` concurrently for every ID.
+        Implementations should override this to retrieve all the items at once.
+
+        Args:
+            item_ids: The IDs of the items to retrieve.
+
+        Returns:
+            List[_I]: The items, in the same order as the IDs.
+
+        Raises:
+            ItemNotFoundException: If any item cannot be found.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_by_id(item_id, **kwargs) for item_id in item_ids)
+            )
+        )
+
     async def get_count(self, **query_filters: Any) -> int:
         """Retrieve a total count of items.
 
@@ -12,7 +12,13 @@ from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from generic_repository import CacheRepository, HttpRepository, MappedRepository
+from generic_repository import (
+    CacheRepository,
+    HttpRepository,
+    LRUCacheRepository,
+    MappedRepository,
+    QueryCacheRepository,
+)
 from generic_repository.mapper import LambdaMapper
 from generic_repository.pydantic import PydanticDictMapper
 from tests.todos import AddTodoPayload, Todo, TodoRepository, UpdateTodoPayload
@@ -129,12 +135,24 @@ def cached_repository(http_todos_repository: TodoRepository):
     return CacheRepository(http_todos_repository)
 
 
+@pytest.fixture()
+def lru_cached_repository(sa_repository: TodoRepository):
+    return LRUCacheRepository(sa_repository, id_getter=lambda item: item.id)
+
+
+@pytest.fixture()
+def query_cached_repository(mapped_sa_repository: TodoRepository):
+    return QueryCacheRepository(mapped_sa_repository)
+
+
 @pytest.fixture(
     params=(
         "sa_repository",
         "http_todos_repository",
         "cached_repository",
         "mapped_sa_repository",
+        "lru_cached_repository",
+        "query_cached_repository",
     )
 )
 def repository(request):
@@ -1,7 +1,12 @@
+import asyncio
+
 import pytest
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from generic_repository import ItemNotFoundException, PooledRepository
+
+from ..factories import AddTodoFactory
 from .todos import DbTodoRepository
 
 pytestmark = [
@@ -17,3 +22,25 @@ async def test_connection(db_session: AsyncSession):
 def test_todo_repository_without_session():
     with pytest.raises(ValueError):
         DbTodoRepository(None)  # type: ignore
+
+
+async def test_pooled_repository(db_sessionmaker, sa_cleanup):
+    repository = PooledRepository(db_sessionmaker.begin, DbTodoRepository)
+    payloads = AddTodoFactory.create_batch(5)
+    items = await asyncio.gather(*(repository.add(payload) for payload in payloads))
+
+    assert await repository.get_count() == len(items)
+    fetched = await asyncio.gather(*(repository.get_by_id(item.id) for item in items))
+    assert fetched == list(items)
+
+
+async def test_get_many_coerces_ids(sa_repository: DbTodoRepository):
+    item = await sa_repository.add(AddTodoFactory())
+    fetched = await sa_repository.get_many([str(item.id)])
+    assert fetched == [await sa_repository.get_by_id(str(item.id))]
+
+
+async def test_get_many_lossy_ids(sa_repository: DbTodoRepository):
+    item = await sa_repository.add(AddTodoFactory())
+    with pytest.raises(ItemNotFoundException):
+        await sa_repository.get_many([item.id + 0.5])
@@ -6,6 +6,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from generic_repository import (
+    ItemNotFoundException,
     LambdaMapper,
     PydanticDictMapper,
     PydanticObjectMapper,
@@ -124,3 +125,16 @@ def test_without_class_cannot_construct_with_session(db_session: AsyncSession):
 
 def test_without_model_can_construct_with_repo(repo: _TodoModelRepository):
     _MappedRepoWithoutModel(repository=repo)
+
+
+@pytest.mark.anyio()
+async def test_get_many_coerces_ids(repo: _TodoModelRepository, sa_cleanup):
+    item = await repo.add({"title": "Title", "text": "Text"})
+    assert await repo.get_many([str(item.id)]) == [item]
+
+
+@pytest.mark.anyio()
+async def test_get_many_lossy_ids(repo: _TodoModelRepository, sa_cleanup):
+    item = await repo.add({"title": "Title", "text": "Text"})
+    with pytest.raises(ItemNotFoundException):
+        await repo.get_many([item.id + 0.5])
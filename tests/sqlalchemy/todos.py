@@ -4,13 +4,11 @@ Todos database implementation.
 
 Contains some database-powered repository implementations.
 """
-from typing import Any
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from generic_repository import (
     DatabaseRepository,
-    LambdaMapper,
+    Mapper,
     PydanticDictMapper,
     PydanticObjectMapper,
     SqlalchemyMappedRepository,
@@ -66,7 +64,7 @@ class DbMappedTodoRepository(
         """
         super().__init__(
             session=session,
-            id_mapper=LambdaMapper[int, Any](lambda x: x),
+            id_mapper=Mapper.identity(),
             item_mapper=PydanticObjectMapper(Todo),
             create_mapper=PydanticDictMapper(AddTodoPayload),
             update_mapper=PydanticDictMapper(UpdateTodoPayload, exclude_unset=True),
@@ -1,11 +1,19 @@
 # pylint: disable=import-error,missing-function-docstring
 """Tests for the cached repository.
 """
+import asyncio
+import datetime
 from unittest import mock
 
 import pytest
 
-from generic_repository import CacheRepository, Repository
+from generic_repository import (
+    CacheRepository,
+    ItemNotFoundException,
+    LRUCacheRepository,
+    QueryCacheRepository,
+    Repository,
+)
 
 
 @pytest.mark.anyio()
@@ -47,3 +55,182 @@ async def test_cached_clear_cache():
     cached.clear_cache()
     await cached.get_list(x=3)
     assert mocked_repo.get_list.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_lru_cached_id():
+    mocked_repo = mock.Mock(Repository)
+    cached = LRUCacheRepository(mocked_repo)
+    await cached.get_by_id(3)
+    await cached.get_by_id(3)
+    mocked_repo.get_by_id.assert_called_once_with(3)
+
+
+@pytest.mark.anyio()
+async def test_lru_evicts_least_recently_used():
+    mocked_repo = mock.Mock(Repository)
+    cached = LRUCacheRepository(mocked_repo, maxsize=2)
+    await cached.get_by_id(1)
+    await cached.get_by_id(2)
+    await cached.get_by_id(1)
+    await cached.get_by_id(3)
+    await cached.get_by_id(1)
+    assert mocked_repo.get_by_id.call_count == 3
+    await cached.get_by_id(2)
+    assert mocked_repo.get_by_id.call_count == 4
+
+
+@pytest.mark.anyio()
+async def test_lru_ttl():
+    mocked_repo = mock.Mock(Repository)
+    cached = LRUCacheRepository(mocked_repo, ttl=0)
+    await cached.get_by_id(3)
+    await cached.get_by_id(3)
+    assert mocked_repo.get_by_id.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_lru_errors_are_not_cached():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_by_id.side_effect = [ItemNotFoundException(), 1]
+    cached = LRUCacheRepository(mocked_repo)
+    with pytest.raises(ItemNotFoundException):
+        await cached.get_by_id(3)
+    assert await cached.get_by_id(3) == 1
+
+
+@pytest.mark.anyio()
+async def test_lru_cancelled_fetch_is_not_cached():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_by_id.side_effect = [asyncio.CancelledError(), 1]
+    cached = LRUCacheRepository(mocked_repo)
+    with pytest.raises(asyncio.CancelledError):
+        await cached.get_by_id(3)
+    assert await cached.get_by_id(3) == 1
+
+
+@pytest.mark.anyio()
+async def test_lru_list_ids():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_many.return_value = ["item"]
+    cached = LRUCacheRepository(mocked_repo)
+    await cached.get_by_id([1, 2])
+    await cached.get_by_id([1, 2])
+    mocked_repo.get_by_id.assert_called_once_with([1, 2])
+    await cached.get_many([[1, 2], [3, 4]])
+    mocked_repo.get_many.assert_called_once_with([[3, 4]])
+
+
+@pytest.mark.anyio()
+async def test_lru_count_filters():
+    mocked_repo = mock.Mock(Repository)
+    cached = LRUCacheRepository(mocked_repo)
+    await cached.get_count(since=datetime.date(2020, 1, 1))
+    await cached.get_count(since=datetime.date(2020, 1, 1))
+    assert mocked_repo.get_count.call_count == 1
+    await cached.get_count(done=True)
+    await cached.get_count(done=1)
+    assert mocked_repo.get_count.call_count == 3
+    await cached.get_count(tags=["a"])
+    await cached.get_count(tags=["a"])
+    assert mocked_repo.get_count.call_count == 5
+
+
+@pytest.mark.anyio()
+async def test_lru_write_through():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.update.return_value = "updated"
+    mocked_repo.add.return_value = 5
+    cached = LRUCacheRepository(mocked_repo, id_getter=lambda item: item)
+    await cached.get_count()
+    assert await cached.update(3, {}) == "updated"
+    assert await cached.get_by_id(3) == "updated"
+    await cached.add({})
+    assert await cached.get_by_id(5) == 5
+    mocked_repo.get_by_id.assert_not_called()
+    await cached.get_count()
+    assert mocked_repo.get_count.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_lru_remove_evicts():
+    mocked_repo = mock.Mock(Repository)
+    cached = LRUCacheRepository(mocked_repo)
+    await cached.get_by_id(3)
+    await cached.remove(3)
+    await cached.get_by_id(3)
+    assert mocked_repo.get_by_id.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cached_list():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_list.return_value = [1, 2]
+    cached = QueryCacheRepository(mocked_repo)
+    result = await cached.get_list(size=2, x=3)
+    result.append(3)
+    assert await cached.get_list(size=2, x=3) == [1, 2]
+    mocked_repo.get_list.assert_called_once_with(offset=None, size=2, x=3)
+    await cached.get_list(size=3, x=3)
+    assert mocked_repo.get_list.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cache_keeps_filter_types_apart():
+    mocked_repo = mock.Mock(Repository)
+    cached = QueryCacheRepository(mocked_repo)
+    await cached.get_count(done=True)
+    await cached.get_count(done=1)
+    await cached.get_list(done=True)
+    await cached.get_list(done=1.0)
+    assert mocked_repo.get_count.call_count == 2
+    assert mocked_repo.get_list.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cached_unhashable_filters():
+    mocked_repo = mock.Mock(Repository)
+    cached = QueryCacheRepository(mocked_repo)
+    await cached.get_count(x=[3])
+    await cached.get_count(x=[3])
+    assert mocked_repo.get_count.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cache_cleared_on_write():
+    mocked_repo = mock.Mock(Repository)
+    cached = QueryCacheRepository(mocked_repo)
+    await cached.get_count()
+    await cached.get_list()
+    await cached.remove(3)
+    await cached.get_count()
+    await cached.get_list()
+    assert mocked_repo.get_count.call_count == 2
+    assert mocked_repo.get_list.call_count == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cache_stale_while_revalidate():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_count.side_effect = [1, 2, 3]
+    cached = QueryCacheRepository(mocked_repo, ttl=0, stale_while_revalidate=True)
+    assert await cached.get_count() == 1
+    assert await cached.get_count() == 1
+    assert await cached.get_count() == 1
+    for _ in range(2):  # Let the refresh and its done callback run.
+        await asyncio.sleep(0)
+    assert mocked_repo.get_count.call_count == 2
+    assert await cached.get_count() == 2
+
+
+@pytest.mark.anyio()
+async def test_query_cache_refresh_dropped_after_write():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_count.side_effect = [1, 2, 3]
+    cached = QueryCacheRepository(mocked_repo, ttl=0, stale_while_revalidate=True)
+    await cached.get_count()
+    await cached.get_count()
+    await cached.add({})
+    for _ in range(2):
+        await asyncio.sleep(0)
+    assert await cached.get_count() == 3
@@ -1,8 +1,138 @@
+# pylint: disable=missing-function-docstring
 """
 Tests for the composition repository.
 """
+import asyncio
+from unittest import mock
+
 import pytest
 
+from generic_repository import (
+    IdentityMapper,
+    LambdaMapper,
+    MappedRepository,
+    Mapper,
+    Repository,
+)
+from generic_repository.mapper import PipelineMapper
+
 pytestmark = [
     pytest.mark.anyio(),
 ]
+
+
+class _AsyncDoubleMapper(Mapper[int, int]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.running = 0
+        self.max_running = 0
+
+    def map_item(self, item: int) -> int:  # pragma: nocover
+        raise AssertionError("The async path should be used.")
+
+    async def amap_item(self, item: int) -> int:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return item * 2
+
+
+def _mapped_repository(repository: Repository, item_mapper: Mapper):
+    return MappedRepository(
+        repository,
+        id_mapper=Mapper.identity(),
+        create_mapper=Mapper.identity(),
+        update_mapper=Mapper.identity(),
+        replace_mapper=Mapper.identity(),
+        item_mapper=item_mapper,
+    )
+
+
+async def test_async_item_mapper_list():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_list.return_value = [1, 2, 3]
+    item_mapper = _AsyncDoubleMapper()
+    repository = _mapped_repository(mocked_repo, item_mapper)
+
+    assert await repository.get_list() == [2, 4, 6]
+    assert item_mapper.max_running == 3
+
+
+async def test_async_item_mapper_item():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_by_id.return_value = 4
+    repository = _mapped_repository(mocked_repo, _AsyncDoubleMapper())
+
+    assert await repository.get_by_id(1) == 8
+    mocked_repo.get_by_id.assert_called_once_with(1)
+
+
+async def test_nested_async_item_mapper():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_list.return_value = [1, 2]
+    increment = LambdaMapper(lambda x: x + 1)
+    pipeline = PipelineMapper(increment, increment.chain(_AsyncDoubleMapper()))
+    repository = _mapped_repository(mocked_repo, pipeline)
+
+    assert await repository.get_list() == [6, 8]
+
+
+class _BatchMapper(Mapper[int, int]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def map_item(self, item: int) -> int:  # pragma: nocover
+        raise AssertionError("The batch path should be used.")
+
+    def map_batch(self, items):
+        self.batches.append(list(items))
+        return [item * 3 for item in self.batches[-1]]
+
+
+async def test_pipeline_uses_stage_batches():
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_list.return_value = [1, 2]
+    batch_mapper = _BatchMapper()
+    pipeline = PipelineMapper(LambdaMapper(lambda x: x + 1), batch_mapper)
+    repository = _mapped_repository(mocked_repo, pipeline)
+
+    assert await repository.get_list() == [6, 9]
+    assert batch_mapper.batches == [[2, 3]]
+
+
+async def test_identity_subclass_is_called():
+    class _LoggingIdentity(IdentityMapper):
+        calls = 0
+
+        def map_item(self, item):
+            type(self).calls += 1
+            return item
+
+    mocked_repo = mock.Mock(Repository)
+    mocked_repo.get_by_id.return_value = 4
+    repository = _mapped_repository(mocked_repo, _LoggingIdentity())
+
+    assert await repository.get_by_id(1) == 4
+    assert _LoggingIdentity.calls == 1
+
+
+async def test_query_filters_are_merged():
+    mocked_repo = mock.Mock(Repository)
+    repository = MappedRepository(
+        mocked_repo,
+        id_mapper=Mapper.identity(),
+        create_mapper=Mapper.identity(),
+        update_mapper=Mapper.identity(),
+        replace_mapper=Mapper.identity(),
+        item_mapper=Mapper.identity(),
+        owner=1,
+    )
+
+    await repository.get_by_id(3)
+    mocked_repo.get_by_id.assert_called_with(3, owner=1)
+    await repository.get_by_id(3, deleted=False)
+    mocked_repo.get_by_id.assert_called_with(3, deleted=False, owner=1)
+    await repository.get_count(owner=2)
+    mocked_repo.get_count.assert_called_with(owner=1)
@@ -83,3 +83,14 @@ async def test_replace(repository: TodoRepository, item: Todo):
     assert item.id  # nosec
     result = await repository.replace(item.id, payload)
     assert result.title == payload.title  # nosec
+
+
+async def test_get_many(repository: TodoRepository, items: List[Todo]):
+    ids = [item.id for item in reversed(items[:5])]
+    result = await repository.get_many(ids)
+    assert [item.id for item in result] == ids  # nosec
+
+
+async def test_get_many_nonexistent(repository: TodoRepository, item: Todo):
+    with pytest.raises(ItemNotFoundException):
+        await repository.get_many([item.id, -1])